@@ -0,0 +1,46 @@
+"""
+Сборка опционального C‑ядра ``stat_ts._core_ext`` (Cython).
+
+Все метаданные пакета лежат в pyproject.toml. Расширение помечено как
+``optional``: если компилятора нет или сборка упала, пакет ставится
+без него и использует numba / NumPy.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # pragma: no cover - Cython указан в build-system.requires
+    cythonize = None
+
+
+def _compile_args() -> list:
+    """
+    Флаги оптимизации под текущий компилятор.
+
+    Без ``-mavx2`` / ``-march``: такой .so падает с SIGILL на x86‑64 без AVX2
+    (ещё при импорте) и не годится для распространяемых колёс, а цикл Велфорда
+    всё равно не векторизуется. ``-ffast-math`` не используем, чтобы не ломать inf/NaN.
+    """
+    if sys.platform == "win32":
+        return ["/O2"]
+    return ["-O3"]
+
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "stat_ts._core_ext",
+                ["src/stat_ts/_core_ext.pyx"],
+                extra_compile_args=_compile_args(),
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
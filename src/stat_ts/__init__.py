@@ -22,10 +22,16 @@ from stat_ts import stat_ts
 df = stat_ts(dates, pnl, test_period=len(pnl), target_type="pct")
 print(df.T)  # выводим метрики в столбик
 
+Много экспериментов – одной таблицей:
+
+from stat_ts import stat_ts_many
+jobs = [{"idx": k, "dates": d, "pnl": p, "test_period": len(p)} for k, (d, p) in runs.items()]
+df = stat_ts_many(jobs, target_type="pct")
+
 """
 from importlib.metadata import version as _get_version
 
-from .core import stat_ts          # точка = текущий пакет; без префикса src
+from .core import stat_ts, stat_ts_batch, stat_ts_dict, stat_ts_many  # точка = текущий пакет; без префикса src
 
-__all__ = ["stat_ts"]
+__all__ = ["stat_ts", "stat_ts_dict", "stat_ts_many", "stat_ts_batch"]
 __version__: str = _get_version(__name__)
@@ -0,0 +1,87 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+_core_ext.pyx
+=============
+
+Предкомпилированное ядро ``stat_ts`` – тот же однопроходный алгоритм,
+что и ``core._core_loop``, но без JIT‑прогрева numba.
+
+Собирается опционально (см. ``setup.py``); если модуль не собран,
+``core.py`` использует numba или NumPy.
+"""
+
+from cython cimport floating
+from libc.math cimport INFINITY, NAN, isnan, sqrt
+
+
+def reduce_all(const floating[::1] daily):
+    """
+    Все метрики подневного ряда за один проход.
+
+    Возвращает ``(mean, std, neg_std, pos_sum, neg_sum, pos_count, neg_count,
+    max_win_run, max_loss_run, drawdown)`` – как ``core._core_loop``.
+    """
+    cdef Py_ssize_t i, n = daily.shape[0]
+    cdef double x, xn, delta, k
+    cdef double mean = 0.0, m2 = 0.0, neg_mean = 0.0, neg_m2 = 0.0
+    cdef double pos_sum = 0.0, neg_sum = 0.0
+    cdef double cs = 0.0, peak = -INFINITY, drawdown = 0.0, gap
+    cdef bint drawdown_nan = False
+    cdef Py_ssize_t pos_count = 0, neg_count = 0
+    cdef Py_ssize_t win_run = 0, loss_run = 0, max_win_run = 0, max_loss_run = 0
+
+    # Цикл не трогает Python‑объекты – отпускаем GIL для пулов потоков
+    with nogil:
+        for i in range(n):
+            x = daily[i]
+            k = i + 1
+            delta = x - mean
+            mean += delta / k
+            m2 += delta * (x - mean)
+
+            xn = 0.0
+            if x > 0:
+                pos_sum += x
+                pos_count += 1
+                win_run += 1
+                loss_run = 0
+                if win_run > max_win_run:
+                    max_win_run = win_run
+            elif x < 0:
+                neg_sum += x
+                neg_count += 1
+                xn = x
+                loss_run += 1
+                win_run = 0
+                if loss_run > max_loss_run:
+                    max_loss_run = loss_run
+            delta = xn - neg_mean
+            neg_mean += delta / k
+            neg_m2 += delta * (xn - neg_mean)
+
+            if x != 0:
+                cs += x
+                if cs > peak:
+                    peak = cs
+                gap = cs - peak
+                if gap < drawdown:
+                    drawdown = gap
+                elif isnan(gap):
+                    # NaN / inf в pnl (inf - inf) «замораживают» сравнения –
+                    # не отдаём правдоподобный 0.0, как и np.min в _core_numpy
+                    drawdown_nan = True
+
+    if drawdown_nan:
+        drawdown = NAN
+    return (
+        mean,
+        sqrt(m2 / n),
+        sqrt(neg_m2 / n),
+        pos_sum,
+        neg_sum,
+        pos_count,
+        neg_count,
+        max_win_run,
+        max_loss_run,
+        drawdown,
+    )
@@ -13,60 +13,575 @@ core.py
 
 from __future__ import annotations
 
-from typing import Literal, Union
+import math
+from concurrent.futures import Executor
+from typing import Any, Iterable, Literal, Mapping, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
-__all__ = ["stat_ts"]
+try:  # numba – опциональная зависимость (pip install "stat-ts[fast]")
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - зависит от окружения
+    njit = None
+    prange = range
+
+try:  # предкомпилированное C‑ядро собирается setup.py, если есть компилятор
+    from ._core_ext import reduce_all as _core_ext
+except ImportError:  # pragma: no cover - зависит от сборки
+    _core_ext = None
+
+__all__ = ["stat_ts", "stat_ts_dict", "stat_ts_many", "stat_ts_batch"]
 
 # Тип для явного указания вариантности процентов / пунктов
 _Target = Literal["pct", "nom"]
+# Бэкенд подневной агрегации
+_Engine = Literal["numpy", "polars"]
+
+
+def _column_names(postfix: str) -> tuple:
+    """Порядок и названия колонок результата для заданного постфикса единиц."""
+    return (
+        "sharpe",
+        "sortino",
+        "Kelly, %",
+        "trades/year",
+        f"return/year, {postfix}",
+        f"return/trade, {postfix}",
+        "PF",
+        "Win, %",
+        f"Avg Win, {postfix}",
+        f"Avg Loss, {postfix}",
+        "Max wins in row",
+        "Max losses in row",
+        f"Max DD, {postfix}",
+    )
+
+
+# Колонки и «пустые» строки считаются один раз при импорте
+_COLUMNS = {"pct": _column_names("%"), "nom": _column_names("pp")}
+_TEMPLATES = {target: dict.fromkeys(cols) for target, cols in _COLUMNS.items()}
+
+
+def _target_key(target: _Target) -> str:
+    """Всё, что не 'pct', трактуется как пункты ('nom')."""
+    return "pct" if target == "pct" else "nom"
 
 
 # ----------------------------------------------------------------------
 # ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ
 # ----------------------------------------------------------------------
-def _empty_row(idx: Union[int, str], target: _Target) -> pd.DataFrame:
-    """Возвращает пустую строку DataFrame, если pnl слишком короткий."""
-    postfix = "%" if target == "pct" else "pp"
-
-    base_cols = {
-        "sharpe": None,
-        "sortino": None,
-        "Kelly, %": None,
-        "trades/year": None,
-        f"return/year, {postfix}": None,
-        f"return/trade, {postfix}": None,
-        "PF": None,
-        "Win, %": None,
-        f"Avg Win, {postfix}": None,
-        f"Avg Loss, {postfix}": None,
-        "Max wins in row": None,
-        "Max losses in row": None,
-        f"Max DD, {postfix}": None,
-    }
-    return pd.DataFrame(base_cols, index=[idx])
+def _empty_metrics(target: _Target) -> dict:
+    """Возвращает словарь метрик со значениями None, если pnl слишком короткий."""
+    return dict(_TEMPLATES[_target_key(target)])
+
+
+# С какой длины ряда серии выгоднее считать по упакованной битовой маске
+_SWAR_MIN_SIZE = 1 << 15
+
+
+def _shift_bits(words: np.ndarray, s: int) -> np.ndarray:
+    """Сдвиг битового массива (uint64, little‑endian) на ``s`` бит к старшим индексам."""
+    q, r = divmod(s, 64)
+    out = np.zeros_like(words)
+    if q >= words.size:
+        return out
+    out[q:] = words[: words.size - q]
+    if r:
+        carry = out >> (64 - r)
+        out <<= r
+        out[1:] |= carry[:-1]  # перенос бит между соседними словами
+    return out
+
+
+def _longest_run_bits(mask: np.ndarray) -> int:
+    """
+    Длина самой длинной серии ``True`` через SWAR по словам из 64 бит.
+
+    Маска упаковывается по 64 значения в ``uint64``. Уровень ``k`` помечает
+    концы серий длиной ≥ 2**k (``A[k+1] = A[k] & (A[k] << 2**k)``), после
+    чего длина добирается двоичным спуском по уровням. Итого
+    O(N/64 · log(max_run)) операций над словами вместо O(N) над байтами.
+    """
+    packed = np.packbits(mask, bitorder="little")
+    pad = -packed.size % 8
+    if pad:
+        packed = np.concatenate((packed, np.zeros(pad, dtype=np.uint8)))
+    level = packed.view("<u8")
+    if not level.any():
+        return 0
+
+    levels = [level]
+    while True:
+        nxt = levels[-1] & _shift_bits(levels[-1], 1 << (len(levels) - 1))
+        if not nxt.any():
+            break
+        levels.append(nxt)
+
+    length = 1 << (len(levels) - 1)
+    ends = levels[-1]
+    for j in range(len(levels) - 2, -1, -1):
+        longer = ends & _shift_bits(levels[j], length)
+        if longer.any():
+            ends = longer
+            length += 1 << j
+    return length
 
 
 def _calc_consecutive(series: np.ndarray, positive: bool = True) -> int:
     """
     Подсчёт максимальной серии подряд положительных/отрицательных значений.
+
+    Векторизованный run‑length: границы серий ищем через ``np.diff`` по
+    маске, обрамлённой нулями, длина серии = конец − начало. На длинных
+    рядах (от ``_SWAR_MIN_SIZE``) – битовый вариант :func:`_longest_run_bits`.
+    """
+    mask = (series > 0) if positive else (series < 0)
+    if mask.size >= _SWAR_MIN_SIZE:
+        return _longest_run_bits(mask)
+    d = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    starts = np.flatnonzero(d == 1)
+    ends = np.flatnonzero(d == -1)
+    return int((ends - starts).max()) if starts.size else 0
+
+
+def _fill_calendar(days: np.ndarray, sums: np.ndarray) -> np.ndarray:
+    """
+    Раскладывает суммы по отсортированным уникальным дням на сплошной календарь.
+
+    ``days`` – номера дней (int64 от эпохи). Дни без сделок (в т.ч. выходные
+    внутри периода) заполняются нулями, как это делает ``resample("1D")``.
+    """
+    if days.size == 0:
+        return sums
+    offsets = days - days[0]
+    daily = np.zeros(offsets[-1] + 1, dtype=sums.dtype)
+    daily[offsets] = sums
+    return daily
+
+
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _float_dtype(dtype) -> np.dtype:
+    """
+    Проверяет внутренний тип расчётов: только float32 или float64.
+
+    Ядра (Cython ``floating``, numba) собраны под эти два типа; float16
+    теряет точность уже на суммах, longdouble платформозависим.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _FLOAT_DTYPES:
+        raise ValueError(f"dtype должен быть float32 или float64, получено {dtype}")
+    return dtype
+
+
+def _as_pnl(pnl, dtype: np.dtype) -> np.ndarray:
+    """
+    Приводит pnl к одномерному массиву нужного типа.
+
+    Для float64‑массивов и серий (в т.ч. срезов общего буфера) ``np.asarray``
+    возвращает представление без копии; копия делается только при смене типа.
+    Непрерывность не требуется – в ядра попадает уже собранный подневной ряд.
+    """
+    arr = np.asarray(pnl, dtype=dtype)
+    if arr.ndim != 1:
+        raise ValueError(f"pnl должен быть одномерным, получена форма {arr.shape}")
+    return arr
+
+
+def _day_numbers(dates, size: int) -> np.ndarray:
+    """
+    Номера календарных дней (int64 от эпохи) для каждого элемента ``dates``.
+
+    Работает напрямую с ``datetime64``, без построения ``DatetimeIndex``.
+    Для tz‑aware дат берутся локальные сутки – как при ``resample``.
+    """
+    if isinstance(dates, pd.Series):
+        dates = dates.array
+    elif not hasattr(dates, "dtype"):
+        dates = pd.DatetimeIndex(dates)  # списки Timestamp / строк
+    if getattr(dates, "tz", None) is not None:
+        dates = dates.tz_localize(None)
+    days = np.asarray(dates, dtype="datetime64[ns]").astype("datetime64[D]").view("i8")
+    if days.size != size:
+        raise ValueError(f"Длины dates ({days.size}) и pnl ({size}) не совпадают")
+    return days
+
+
+def _drop_nat(days: np.ndarray, pnl: np.ndarray) -> tuple:
+    """Отбрасывает бары с датой NaT – ``resample`` их тоже не учитывает."""
+    nat_mask = days == np.iinfo(np.int64).min
+    if nat_mask.any():
+        days = days[~nat_mask]
+        pnl = pnl[~nat_mask]
+    return days, pnl
+
+
+def _daily_sum(dates: pd.DatetimeIndex, pnl: np.ndarray) -> np.ndarray:
+    """
+    Суммы PnL по календарным дням – аналог ``resample("1D").sum()`` без pandas.
+
+    Как и ``resample``, NaN при суммировании пропускаются (например, первый
+    бар после ``pct_change()``); в ``reduceat`` они бы «заразили» весь день.
+    Бары с датой NaT отбрасываются.
+    """
+    days, pnl = _drop_nat(_day_numbers(dates, pnl.size), pnl)
+    if days.size == 0:
+        return pnl
+    nan_mask = np.isnan(pnl)
+    if nan_mask.any():
+        pnl = np.where(nan_mask, 0, pnl)
+
+    steps = np.diff(days)
+    if (steps < 0).any():
+        order = np.argsort(days, kind="stable")
+        days = days[order]
+        pnl = pnl[order]
+        steps = np.diff(days)
+
+    boundaries = np.concatenate(([0], np.flatnonzero(steps) + 1))
+    sums = np.add.reduceat(pnl, boundaries)
+    return _fill_calendar(days[boundaries], sums)
+
+
+def _daily_sum_polars(dates: pd.DatetimeIndex, pnl: np.ndarray) -> np.ndarray:
+    """То же, что :func:`_daily_sum`, но группировка выполняется в Polars."""
+    try:
+        import polars as pl
+    except ImportError as exc:  # pragma: no cover - зависит от окружения
+        raise ImportError(
+            'engine="polars" требует пакет polars: pip install "stat-ts[polars]"'
+        ) from exc
+
+    days, pnl = _drop_nat(_day_numbers(dates, pnl.size), pnl)
+    by_day = (
+        pl.LazyFrame({"day": days, "pnl": pnl})
+        .group_by("day")
+        .agg(pl.col("pnl").fill_nan(0).sum())
+        .sort("day")
+        .collect()
+    )
+    return _fill_calendar(by_day["day"].to_numpy(), by_day["pnl"].to_numpy())
+
+
+_DAILY_SUM = {"numpy": _daily_sum, "polars": _daily_sum_polars}
+
+
+def _core_loop(daily: np.ndarray) -> tuple:
+    """
+    Вся числовая часть ``stat_ts`` за один проход по подневному ряду.
+
+    Среднее и дисперсии считаются по Велфорду (устойчиво к сокращению
+    порядков), параллельно копятся суммы и счётчики по знаку, серии
+    побед / проигрышей и просадка. Нулевые дни серии не прерывают и
+    на кумулятивную кривую не влияют.
+
+    Возвращает ``(mean, std, neg_std, pos_sum, neg_sum, pos_count, neg_count,
+    max_win_run, max_loss_run, drawdown)``.
+    """
+    mean = 0.0
+    m2 = 0.0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+    pos_sum = 0.0
+    neg_sum = 0.0
+    pos_count = 0
+    neg_count = 0
+    win_run = 0
+    loss_run = 0
+    max_win_run = 0
+    max_loss_run = 0
+    cs = 0.0
+    peak = -np.inf
+    drawdown = 0.0
+    drawdown_nan = False
+    for i in range(daily.size):
+        x = daily[i]
+        k = i + 1
+        delta = x - mean
+        mean += delta / k
+        m2 += delta * (x - mean)
+
+        xn = 0.0
+        if x > 0:
+            pos_sum += x
+            pos_count += 1
+            win_run += 1
+            loss_run = 0
+            if win_run > max_win_run:
+                max_win_run = win_run
+        elif x < 0:
+            neg_sum += x
+            neg_count += 1
+            xn = x
+            loss_run += 1
+            win_run = 0
+            if loss_run > max_loss_run:
+                max_loss_run = loss_run
+        delta = xn - neg_mean
+        neg_mean += delta / k
+        neg_m2 += delta * (xn - neg_mean)
+
+        if x != 0:
+            cs += x
+            if cs > peak:
+                peak = cs
+            gap = cs - peak
+            if gap < drawdown:
+                drawdown = gap
+            elif np.isnan(gap):
+                # NaN / inf в pnl (inf - inf) «замораживают» сравнения –
+                # не отдаём правдоподобный 0.0, как и np.min в _core_numpy
+                drawdown_nan = True
+
+    if drawdown_nan:
+        drawdown = np.nan
+    n = daily.size
+    return (
+        mean,
+        np.sqrt(m2 / n),
+        np.sqrt(neg_m2 / n),
+        pos_sum,
+        neg_sum,
+        pos_count,
+        neg_count,
+        max_win_run,
+        max_loss_run,
+        drawdown,
+    )
+
+
+def _drawdown_numpy(pnl_nz: np.ndarray) -> float:
+    """
+    Максимальная просадка кумулятивной кривой (NumPy‑фолбэк).
+
+    В numba / C‑ядре то же самое делается на лету в общем проходе
+    (``cs += x; peak = max(peak, cs); dd = min(dd, cs - peak)``); здесь –
+    векторно, в двух буферах с in‑place операциями.
+    """
+    if not pnl_nz.size:
+        return 0.0
+    cs = np.cumsum(pnl_nz)
+    peak = np.maximum.accumulate(cs)
+    np.subtract(cs, peak, out=peak)
+    return peak.min()
+
+
+def _std_inplace(buf: np.ndarray) -> float:
+    """
+    Стандартное отклонение (ddof=0) вокруг среднего; ``buf`` портится.
+
+    Ряд сначала сдвигается на первый элемент: дисперсия от сдвига не
+    меняется, а константный ряд даёт ровно 0 – как Велфорд в _core_loop
+    (``sum / n`` сам по себе не всегда возвращает исходную константу).
+    """
+    buf -= buf[0]
+    buf -= buf.sum() / buf.size
+    return np.sqrt(buf.dot(buf) / buf.size)
+
+
+def _core_numpy(daily: np.ndarray) -> tuple:
+    """NumPy‑вариант :func:`_core_loop` для окружений без numba и C‑ядра."""
+    pos = daily > 0
+    neg = daily < 0
+
+    # Один рабочий буфер: сам ряд, затем min(x, 0) / max(x, 0) – без масочных выборок
+    part = daily.copy()
+    daily_std = _std_inplace(part)
+    np.minimum(daily, 0.0, out=part)
+    neg_sum = part.sum()
+    neg_std = _std_inplace(part)
+    np.maximum(daily, 0.0, out=part)
+    pos_sum = part.sum()
+
+    pnl_nz = daily[daily != 0]  # NaN‑дни остаются и дают NaN в просадке
+    max_win_run = _calc_consecutive(pnl_nz, positive=True)
+    max_loss_run = _calc_consecutive(pnl_nz, positive=False)
+
+    drawdown = _drawdown_numpy(pnl_nz)
+
+    return (
+        daily.mean(),
+        daily_std,
+        neg_std,
+        pos_sum,
+        neg_sum,
+        int(np.count_nonzero(pos)),
+        int(np.count_nonzero(neg)),
+        max_win_run,
+        max_loss_run,
+        drawdown,
+    )
+
+
+# nogil=True: ядро можно гонять из ThreadPoolExecutor параллельно
+_core_jit = njit(cache=True, nogil=True)(_core_loop) if njit is not None else None
+
+# Приоритет: C‑расширение (без прогрева) → numba → NumPy
+if _core_ext is not None:
+    _core = _core_ext
+elif _core_jit is not None:
+    _core = _core_jit
+else:
+    _core = _core_numpy
+
+# Число значений, которые возвращает _core (и ширина выхода _batch_core)
+_N_CORE = 10
+
+
+def _batch_core_loop(flat: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Прогоняет ядро по каждому ряду из склеенного массива (numba‑версия).
+
+    Ряд ``k`` – это ``flat[offsets[k]:offsets[k + 1]]``. Цикл выполняется
+    через ``prange``, т.е. параллельно по ядрам без GIL.
     """
-    best, current = 0, 0
-    for val in series:
-        cond = val > 0 if positive else val < 0
-        if cond:
-            current += 1
-            best = max(best, current)
-        else:
-            current = 0
-    return best
+    n = offsets.size - 1
+    out = np.empty((n, _N_CORE))
+    for k in prange(n):
+        r = _core_jit(flat[offsets[k] : offsets[k + 1]])
+        out[k, 0] = r[0]
+        out[k, 1] = r[1]
+        out[k, 2] = r[2]
+        out[k, 3] = r[3]
+        out[k, 4] = r[4]
+        out[k, 5] = r[5]
+        out[k, 6] = r[6]
+        out[k, 7] = r[7]
+        out[k, 8] = r[8]
+        out[k, 9] = r[9]
+    return out
+
+
+def _batch_core_py(flat: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """То же, что :func:`_batch_core_loop`, последовательно через ``_core``."""
+    out = np.empty((offsets.size - 1, _N_CORE))
+    for k in range(offsets.size - 1):
+        out[k] = _core(flat[offsets[k] : offsets[k + 1]])
+    return out
+
+
+if njit is not None:
+    _batch_core = njit(cache=True, nogil=True, parallel=True)(_batch_core_loop)
+else:
+    _batch_core = _batch_core_py
+
+
+def _format_metrics(
+    core: tuple,
+    pnl: np.ndarray,
+    test_period: int,
+    target_type: _Target,
+    days_in_year: int,
+) -> dict:
+    """Годовая нормализация, округление и сборка словаря метрик из результата ``_core``."""
+    scale = 100.0 if target_type == "pct" else 1.0
+    sqrt_days = math.sqrt(days_in_year)
+
+    # ------------------------------------------------
+    # 1. Базовые коэффициенты пересчёта в годовые значения
+    # ------------------------------------------------
+    annual_coef = days_in_year / test_period
+    nz = int(np.count_nonzero(pnl))
+    trades = int(nz * annual_coef)  # сделки/год
+    pnl_sum = float(pnl.sum())  # итоговые метрики всегда во float64
+    total_return = pnl_sum * annual_coef
+    return_per_trade = pnl_sum / nz if nz else 0
+
+    # ------------------------------------------------
+    # 2. Метрики подневного ряда (посчитаны в _core)
+    # ------------------------------------------------
+    (
+        daily_mean,
+        daily_std,
+        neg_std,
+        positive_sum,
+        negative_sum,
+        win_count,
+        loss_count,
+        max_win_cons,
+        max_loss_cons,
+        drawdown,
+    ) = (float(v) for v in core)
+
+    sharpe = round((daily_mean / daily_std) * sqrt_days, 3) if daily_std else np.inf
+    sortino = round((daily_mean / neg_std) * sqrt_days, 3) if neg_std else np.inf
+
+    # Profit Factor
+    profit_factor = abs(positive_sum / negative_sum) if negative_sum else np.inf
+
+    # Win‑ratio и Kelly
+    # Без ненулевых дней (нет сделок или они гасятся внутри дня) побед нет
+    traded_days = win_count + loss_count
+    win_pct = win_count / traded_days if traded_days else 0.0
+    kelly = round((win_pct - (1 - win_pct) / profit_factor) * 100, 2) if profit_factor else 0
+
+    # ------------------------------------------------
+    # 3. Серии побед / проигрышей и просадка
+    # ------------------------------------------------
+    max_dd = round(drawdown * scale, 2)
+
+    # Средние выигрыши / убытки
+    avg_win = round(positive_sum / win_count * scale, 3) if win_count else 0
+    avg_loss = round(negative_sum / loss_count * scale, 3) if loss_count else 0
+
+    # ------------------------------------------------
+    # 4. Финальная сборка результатов
+    # ------------------------------------------------
+    values = (
+        sharpe,
+        sortino,
+        kelly,
+        trades,
+        round(total_return * scale, 2),
+        round(return_per_trade * scale, 3),
+        round(profit_factor, 2),
+        round(win_pct * 100, 2),
+        avg_win,
+        avg_loss,
+        int(max_win_cons),
+        int(max_loss_cons),
+        max_dd,
+    )
+    result = dict(zip(_COLUMNS[_target_key(target_type)], values))
+
+    return result
 
 
 # ----------------------------------------------------------------------
 # ОСНОВНАЯ ФУНКЦИЯ
 # ----------------------------------------------------------------------
+def stat_ts_dict(
+    dates: pd.DatetimeIndex,
+    pnl: Union[np.ndarray, pd.Series],
+    test_period: int,
+    target_type: _Target = "pct",
+    days_in_year: int = 365,
+    engine: _Engine = "numpy",
+    dtype: np.dtype = np.float64,
+) -> dict:
+    """
+    То же, что :func:`stat_ts`, но возвращает обычный ``dict`` метрик.
+
+    Без построения DataFrame – удобно, когда строки собираются в цикле по
+    экспериментам и превращаются в таблицу один раз (см. :func:`stat_ts_many`).
+    Параметры совпадают с :func:`stat_ts` (кроме ``idx``).
+    """
+    if engine not in _DAILY_SUM:
+        raise ValueError(f"Неизвестный engine: {engine!r} (ожидается 'numpy' или 'polars')")
+    pnl = _as_pnl(pnl, _float_dtype(dtype))
+
+    # --- быстрый выход, если данных слишком мало ---
+    if pnl.size <= 1:
+        return _empty_metrics(target_type)
+
+    daily = _DAILY_SUM[engine](dates, pnl)
+    if daily.size == 0:  # все даты – NaT
+        return _empty_metrics(target_type)
+    return _format_metrics(_core(daily), pnl, test_period, target_type, days_in_year)
+
+
 def stat_ts(
     dates: pd.DatetimeIndex,
     pnl: Union[np.ndarray, pd.Series],
@@ -74,6 +589,8 @@ def stat_ts(
     idx: Union[int, str] = 0,
     target_type: _Target = "pct",
     days_in_year: int = 365,
+    engine: _Engine = "numpy",
+    dtype: np.dtype = np.float64,
 ) -> pd.DataFrame:
     """
     Рассчитывает ключевые статистики PnL‑ряда стратегии.
@@ -92,95 +609,138 @@ def stat_ts(
         Относительные (`pct` – проценты) или абсолютные (`nom` – пункты) значения.
     days_in_year : int, default 365
         Число дней в году для годовой стандартизации.
+    engine : {'numpy', 'polars'}, default 'numpy'
+        Чем выполнять подневную агрегацию. ``'polars'`` требует установленный
+        пакет polars и даёт тот же результат; быстрее ``'numpy'`` он не
+        работает – удобен, если данные уже живут в Polars‑пайплайне.
+    dtype : np.dtype, default np.float64
+        Тип, в котором ведутся внутренние расчёты. ``np.float32`` вдвое
+        уменьшает объём данных (быстрее на длинных рядах), но суммы и
+        просадка могут отличаться в 6‑7 значащей цифре; итоговые метрики
+        всё равно округляются во float64. Другие типы (float16, longdouble,
+        целые) не поддерживаются – ``ValueError``.
 
     Returns
     -------
     pd.DataFrame
         Одна строка с рассчитанными метриками.
     """
-    pnl = np.asarray(pnl, dtype=float)
+    result = stat_ts_dict(dates, pnl, test_period, target_type, days_in_year, engine, dtype)
+    # Конструктор из dict здесь быстрее вариантов со списком значений и
+    # явными columns; для множества строк используйте stat_ts_many.
+    return pd.DataFrame(result, index=[idx])
 
-    # --- быстрый выход, если данных слишком мало ---
-    if pnl.size <= 1:
-        return _empty_row(idx, target_type)
 
-    # ------------------------------------------------
-    # 1. Базовые коэффициенты пересчёта в годовые значения
-    # ------------------------------------------------
-    annual_coef = days_in_year / test_period
-    trades = int(np.count_nonzero(pnl) * annual_coef)  # сделки/год
-    total_return = pnl.sum() * annual_coef
-    nonzero_mask = pnl != 0
-    return_per_trade = (
-        pnl.sum() / np.count_nonzero(nonzero_mask) if np.count_nonzero(nonzero_mask) else 0
-    )
+def _run_job(params: Mapping[str, Any]) -> dict:
+    """Один вызов :func:`stat_ts_dict` – функция уровня модуля, чтобы её можно было пиклить."""
+    return stat_ts_dict(**params)
 
-    # ------------------------------------------------
-    # 2. Подневная агрегация для Sharpe / Sortino
-    # ------------------------------------------------
-    df = pd.DataFrame({"pnl": pnl}, index=dates).resample("1D").sum()
 
-    daily_mean = df["pnl"].mean()
-    daily_std = df["pnl"].std(ddof=0)
-    sharpe = round((daily_mean / daily_std) * np.sqrt(days_in_year), 3) if daily_std else np.inf
+def stat_ts_many(
+    jobs: Iterable[Mapping[str, Any]],
+    executor: Optional[Executor] = None,
+    **defaults: Any,
+) -> pd.DataFrame:
+    """
+    Пакетный расчёт: одна строка на эксперимент, DataFrame строится один раз.
 
-    df["pnl_negative"] = np.where(df["pnl"] < 0, df["pnl"], 0)
-    neg_std = df["pnl_negative"].std(ddof=0)
-    sortino = round((daily_mean / neg_std) * np.sqrt(days_in_year), 3) if neg_std else np.inf
+    Параметры
+    ---------
+    jobs : iterable of mapping
+        Аргументы :func:`stat_ts` для каждого эксперимента (``dates``, ``pnl``,
+        ``test_period`` и т.д.). Ключ ``idx`` задаёт индекс строки; без него
+        используется порядковый номер задания.
+    executor : concurrent.futures.Executor, optional
+        Если передан, задания считаются через ``executor.map``. Числовое ядро
+        (numba / C) отпускает GIL, поэтому ``ThreadPoolExecutor`` даёт
+        реальный параллелизм; сборка итогового DataFrame остаётся в
+        вызывающем потоке и держит GIL.
+    **defaults
+        Общие аргументы для всех заданий (например, ``target_type="nom"``);
+        значения из задания имеют приоритет.
 
-    # Profit Factor
-    positive_sum = df.loc[df["pnl"] > 0, "pnl"].sum()
-    negative_sum = df.loc[df["pnl"] < 0, "pnl"].sum()
-    profit_factor = abs(positive_sum / negative_sum) if negative_sum else np.inf
+    Returns
+    -------
+    pd.DataFrame
+        По строке на каждое задание.
 
-    # Win‑ratio и Kelly
-    win_days = df["pnl"] > 0
-    win_pct = win_days.sum() / np.count_nonzero(df["pnl"])
-    kelly = round((win_pct - (1 - win_pct) / profit_factor) * 100, 2) if profit_factor else 0
+    Пример
+    ------
+    >>> jobs = [{"idx": k, "dates": d, "pnl": p, "test_period": len(p)}
+    ...         for k, (d, p) in series.items()]
+    >>> df_stats = stat_ts_many(jobs, target_type="pct")
+    """
+    index, params = [], []
+    for i, job in enumerate(jobs):
+        p = {**defaults, **job}
+        index.append(p.pop("idx", i))
+        params.append(p)
 
-    # ------------------------------------------------
-    # 3. Итеративные метрики (серии побед / проигрышей, просадка)
-    # ------------------------------------------------
-    pnl_nz = df.loc[df["pnl"] != 0, "pnl"].to_numpy()
-    max_win_cons = _calc_consecutive(pnl_nz, positive=True)
-    max_loss_cons = _calc_consecutive(pnl_nz, positive=False)
+    if executor is None:
+        rows = [_run_job(p) for p in params]
+    else:
+        rows = list(executor.map(_run_job, params))
+    return pd.DataFrame(rows, index=index)
 
-    # Кумаулятивная просадка
-    cs = np.cumsum(pnl_nz)
-    drawdown = np.min(cs - np.maximum.accumulate(cs))
-    max_dd = round(drawdown * (100 if target_type == "pct" else 1), 2)
 
-    # Средние выигрыши / убытки
-    avg_win = (
-        round(df.loc[df["pnl"] > 0, "pnl"].mean() * (100 if target_type == "pct" else 1), 3)
-        if (df["pnl"] > 0).any()
-        else 0
-    )
-    avg_loss = (
-        round(df.loc[df["pnl"] < 0, "pnl"].mean() * (100 if target_type == "pct" else 1), 3)
-        if (df["pnl"] < 0).any()
-        else 0
-    )
+def stat_ts_batch(
+    dates_list: Sequence[pd.DatetimeIndex],
+    pnl_list: Sequence[Union[np.ndarray, pd.Series]],
+    test_periods: Union[int, Sequence[int]],
+    index: Optional[Sequence[Union[int, str]]] = None,
+    target_type: _Target = "pct",
+    days_in_year: int = 365,
+    dtype: np.dtype = np.float64,
+) -> pd.DataFrame:
+    """
+    Параллельный расчёт статистик для множества рядов.
 
-    # ------------------------------------------------
-    # 4. Финальная сборка результатов
-    # ------------------------------------------------
-    postfix = "%" if target_type == "pct" else "pp"
-
-    result = {
-        "sharpe": sharpe,
-        "sortino": sortino,
-        "Kelly, %": kelly,
-        "trades/year": trades,
-        f"return/year, {postfix}": round(total_return * (100 if target_type == "pct" else 1), 2),
-        f"return/trade, {postfix}": round(return_per_trade * (100 if target_type == "pct" else 1), 3),
-        "PF": round(profit_factor, 2),
-        "Win, %": round(win_pct * 100, 2),
-        f"Avg Win, {postfix}": avg_win,
-        f"Avg Loss, {postfix}": avg_loss,
-        "Max wins in row": max_win_cons,
-        "Max losses in row": max_loss_cons,
-        f"Max DD, {postfix}": max_dd,
-    }
+    Подневные ряды склеиваются в один массив со смещениями, и ядро
+    прогоняется по всем стратегиям сразу (при установленной numba –
+    параллельно по ядрам через ``prange``). Результат совпадает с
+    :func:`stat_ts_many` для тех же рядов.
 
-    return pd.DataFrame(result, index=[idx])
+    Параметры
+    ---------
+    dates_list, pnl_list : sequence
+        Даты и PnL каждой стратегии (попарно, одинаковой длины).
+    test_periods : int | sequence of int
+        Длина тестовой выборки – общая или своя для каждого ряда.
+    index : sequence, optional
+        Индексы строк результата; по умолчанию ``0..n-1``.
+    target_type, days_in_year, dtype
+        Как в :func:`stat_ts`.
+
+    Returns
+    -------
+    pd.DataFrame
+        По строке на каждый ряд.
+    """
+    if len(dates_list) != len(pnl_list):
+        raise ValueError("dates_list и pnl_list должны быть одной длины")
+    n = len(pnl_list)
+    if isinstance(test_periods, (int, np.integer)):
+        test_periods = [test_periods] * n
+    elif len(test_periods) != n:
+        raise ValueError(f"Длина test_periods ({len(test_periods)}) не совпадает с числом рядов ({n})")
+    if index is None:
+        index = range(n)
+    elif len(index) != n:
+        raise ValueError(f"Длина index ({len(index)}) не совпадает с числом рядов ({n})")
+
+    dtype = _float_dtype(dtype)
+    pnls = [_as_pnl(pnl, dtype) for pnl in pnl_list]
+    # короткие ряды и ряды из одних NaT‑дат остаются с пустыми метриками
+    dailies = [_daily_sum(dates, pnl) if pnl.size > 1 else pnl[:0] for dates, pnl in zip(dates_list, pnls)]
+    valid = [k for k in range(n) if dailies[k].size]
+    dailies = [dailies[k] for k in valid]
+
+    rows = [_empty_metrics(target_type) for _ in range(n)]
+    if dailies:
+        offsets = np.zeros(len(dailies) + 1, dtype=np.int64)
+        np.cumsum([d.size for d in dailies], out=offsets[1:])
+        cores = _batch_core(np.concatenate(dailies), offsets)
+        for k, core in zip(valid, cores):
+            rows[k] = _format_metrics(tuple(core), pnls[k], test_periods[k], target_type, days_in_year)
+
+    return pd.DataFrame(rows, index=list(index))
@@ -8,8 +8,9 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from stat_ts import stat_ts
+from stat_ts import stat_ts, stat_ts_batch, stat_ts_many
 
 
 def _make_series(n: int, mu: float = 0.001, sigma: float = 0.01):
@@ -49,3 +50,268 @@ def test_short_series_returns_empty_row():
     df = stat_ts(dates, pnl, test_period=len(pnl), target_type="pct")
     # sharpe == None указывает, что сработал «пустой» путь
     assert df.loc[0, "sharpe"] is None
+
+
+def test_consecutive_runs():
+    """Максимальные серии считаются по ненулевым дням, нули серию не рвут."""
+    dates = pd.date_range("2024-01-01", periods=9, freq="D")
+    pnl = np.array([1.0, 2.0, 0.0, 3.0, -1.0, -2.0, 1.0, -1.0, -1.0])
+    df = stat_ts(dates, pnl, test_period=len(pnl), target_type="nom")
+    assert df.loc[0, "Max wins in row"] == 3
+    assert df.loc[0, "Max losses in row"] == 2
+
+
+def test_unsorted_dates_match_sorted():
+    """Порядок входных дат не влияет на результат (подневная агрегация)."""
+    dates, pnl = _make_series(80)
+    order = np.random.default_rng(seed=7).permutation(len(pnl))
+    df_sorted = stat_ts(dates, pnl, test_period=len(pnl))
+    df_shuffled = stat_ts(dates[order], pnl[order], test_period=len(pnl))
+    assert df_sorted.loc[0, "sharpe"] == df_shuffled.loc[0, "sharpe"]
+    assert df_sorted.loc[0, "Max DD, %"] == df_shuffled.loc[0, "Max DD, %"]
+
+
+def test_core_loop_matches_numpy():
+    """Однопроходное ядро совпадает с NumPy‑фолбэком (серии и просадка тоже)."""
+    from stat_ts.core import _core_loop, _core_numpy
+
+    _, pnl = _make_series(200)
+    pnl[::5] = 0.0
+    assert np.allclose(_core_loop(pnl), _core_numpy(pnl), rtol=1e-10, atol=0)
+    # константные ряды – ровно нулевые std / neg_std во всех ядрах, без ошибок округления
+    for const in (np.full(10, 0.01), np.full(10, -0.01), np.full(7, -0.3)):
+        loop, fallback = _core_loop(const), _core_numpy(const)
+        assert loop[1] == fallback[1] == 0.0
+        assert loop[2] == fallback[2]
+    assert _core_numpy(np.full(10, -0.01))[2] == 0.0
+
+
+def test_polars_engine_matches_numpy():
+    """engine='polars' даёт те же метрики, что и NumPy‑агрегация."""
+    pytest.importorskip("polars")
+    dates, pnl = _make_series(100)
+    df_np = stat_ts(dates, pnl, test_period=len(pnl))
+    df_pl = stat_ts(dates, pnl, test_period=len(pnl), engine="polars")
+    pd.testing.assert_frame_equal(df_np, df_pl)
+
+
+def test_many_matches_single_calls():
+    """stat_ts_many собирает те же строки, что и отдельные вызовы stat_ts."""
+    jobs = []
+    for k, n in enumerate((40, 60, 100)):
+        dates, pnl = _make_series(n, mu=0.001 * k)
+        jobs.append({"idx": f"exp{k}", "dates": dates, "pnl": pnl, "test_period": n})
+
+    df_many = stat_ts_many(jobs, target_type="nom")
+    df_single = pd.concat(
+        [stat_ts(j["dates"], j["pnl"], j["test_period"], idx=j["idx"], target_type="nom") for j in jobs]
+    )
+    pd.testing.assert_frame_equal(df_many, df_single)
+
+
+def test_batch_matches_many():
+    """stat_ts_batch (склеенный массив + ядро по смещениям) совпадает с stat_ts_many."""
+    series = [_make_series(n, mu=0.0005 * n) for n in (1, 30, 75, 120)]
+    dates_list = [d for d, _ in series]
+    pnl_list = [p for _, p in series]
+    test_periods = [len(p) for p in pnl_list]
+
+    df_batch = stat_ts_batch(dates_list, pnl_list, test_periods, index=list("abcd"))
+    jobs = [
+        {"idx": i, "dates": d, "pnl": p, "test_period": t}
+        for i, d, p, t in zip("abcd", dates_list, pnl_list, test_periods)
+    ]
+    pd.testing.assert_frame_equal(df_batch, stat_ts_many(jobs))
+
+
+def test_batch_length_validation():
+    """Несогласованные длины test_periods / index – ValueError, а не молчаливая обрезка."""
+    series = [_make_series(n) for n in (30, 40, 50)]
+    dates_list = [d for d, _ in series]
+    pnl_list = [p for _, p in series]
+
+    with pytest.raises(ValueError, match="test_periods"):
+        stat_ts_batch(dates_list, pnl_list, [30, 40])
+    with pytest.raises(ValueError, match="index"):
+        stat_ts_batch(dates_list, pnl_list, 30, index=list("ab"))
+    with pytest.raises(ValueError, match="index"):
+        stat_ts_batch(dates_list, pnl_list, 30, index=list("abcd"))
+
+
+def test_float32_close_to_float64():
+    """dtype=float32 даёт те же метрики с точностью до округления."""
+    dates, pnl = _make_series(100)
+    df64 = stat_ts(dates, pnl, test_period=len(pnl))
+    df32 = stat_ts(dates, pnl, test_period=len(pnl), dtype=np.float32)
+    assert (df32.dtypes == df64.dtypes).all()
+    assert np.allclose(df32.to_numpy(float), df64.to_numpy(float), atol=0.02)
+
+
+def test_c_extension_matches_loop():
+    """Собранное C‑ядро совпадает с эталонным однопроходным циклом."""
+    ext = pytest.importorskip("stat_ts._core_ext")
+    from stat_ts.core import _core_loop
+
+    _, pnl = _make_series(300)
+    pnl[::4] = 0.0
+    assert np.allclose(ext.reduce_all(pnl), _core_loop(pnl), rtol=1e-12, atol=0)
+    pnl32 = pnl.astype(np.float32)
+    assert np.allclose(ext.reduce_all(pnl32), _core_loop(pnl32), rtol=1e-6)
+
+
+def test_drawdown_peak_starts_at_first_trade():
+    """Пик кривой отсчитывается с первой сделки, а не с нуля – во всех ядрах."""
+    from stat_ts.core import _core_loop, _drawdown_numpy
+
+    pnl = np.array([0.0, -1.0, -1.0, 2.0, 0.0, -3.0, 1.0])
+    assert _core_loop(pnl)[-1] == -3.0
+    assert _drawdown_numpy(pnl[pnl != 0]) == -3.0
+
+    dates = pd.date_range("2024-01-01", periods=3, freq="D")
+    df = stat_ts(dates, np.array([-1.0, -1.0, 2.0]), test_period=3, target_type="nom")
+    assert df.loc[0, "Max DD, pp"] == -1.0
+
+
+def test_swar_runs_match_loop():
+    """Битовый (SWAR) подсчёт серий совпадает с однопроходным ядром."""
+    from stat_ts.core import _SWAR_MIN_SIZE, _calc_consecutive, _core_loop
+
+    rng = np.random.default_rng(seed=3)
+    pnl = rng.normal(0.0, 1.0, size=_SWAR_MIN_SIZE + 123)
+    pnl[999], pnl[1300] = -1.0, -1.0
+    pnl[1000:1300] = 1.0  # длинная серия через границы 64‑битных слов
+    core = _core_loop(pnl)
+    assert _calc_consecutive(pnl, positive=True) == core[7] == 300
+    assert _calc_consecutive(pnl, positive=False) == core[8]
+
+
+def test_many_with_thread_pool():
+    """stat_ts_many через ThreadPoolExecutor даёт тот же результат, что и без него."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    jobs = []
+    for k in range(6):
+        dates, pnl = _make_series(50 + 10 * k)
+        jobs.append({"dates": dates, "pnl": pnl, "test_period": len(pnl)})
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        df_pool = stat_ts_many(jobs, executor=pool)
+    pd.testing.assert_frame_equal(df_pool, stat_ts_many(jobs))
+
+
+def test_pnl_validation_and_no_copy():
+    """pnl должен быть одномерным; float64‑срез общего буфера не копируется."""
+    from stat_ts.core import _as_pnl
+
+    buf = np.random.default_rng(seed=1).normal(size=(4, 50))
+    view = _as_pnl(buf[:, 7], np.dtype(np.float64))
+    assert np.shares_memory(view, buf)
+
+    dates, pnl = _make_series(50)
+    with pytest.raises(ValueError):
+        stat_ts(dates, pnl.reshape(-1, 1), test_period=len(pnl))
+    # на Windows / ARM‑macOS longdouble совпадает с float64 и допустим
+    wide = [np.longdouble] if np.dtype(np.longdouble).itemsize > 8 else []
+    for dtype in [np.float16, np.int64, *wide]:
+        with pytest.raises(ValueError, match="dtype"):
+            stat_ts(dates, pnl, test_period=len(pnl), dtype=dtype)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "polars"])
+def test_nan_pnl_skipped_in_daily_sums(engine):
+    """NaN в pnl (например, после pct_change) пропускаются, как в resample("1D").sum()."""
+    if engine == "polars":
+        pytest.importorskip("polars")
+    dates = pd.date_range("2024-01-01", periods=10)
+    pnl = np.r_[np.nan, np.random.default_rng(seed=0).normal(0.001, 0.01, size=9)]
+
+    df_nan = stat_ts(dates, pnl, test_period=len(pnl), engine=engine)
+    df_zero = stat_ts(dates, np.nan_to_num(pnl), test_period=len(pnl), engine=engine)
+    daily_cols = ["sharpe", "sortino", "PF", "Win, %", "Max DD, %"]
+    pd.testing.assert_frame_equal(df_nan[daily_cols], df_zero[daily_cols])
+    # значения совпадают с исходной реализацией на resample
+    assert df_nan.loc[0, "sharpe"] == 9.632
+    assert df_nan.loc[0, "Max DD, %"] == -0.6
+
+
+def test_kernels_never_report_zero_drawdown_for_nan():
+    """NaN или inf, дошедшие до ядра, дают NaN в просадке, а не правдоподобный 0.0."""
+    from stat_ts import core
+
+    kernels = [core._core_loop, core._core_numpy, core._core]
+    if core._core_ext is not None:
+        kernels.append(core._core_ext)
+    cases = [
+        np.array([0.01, -0.02, np.nan, 0.03, -0.01]),
+        np.r_[np.inf, np.random.default_rng(seed=0).normal(size=9)],
+        np.array([0.01, np.inf, -0.02]),
+        np.array([-np.inf, 0.01, -0.02]),
+    ]
+    with np.errstate(invalid="ignore"):  # inf - inf в чисто‑Python / NumPy ядрах
+        for daily in cases:
+            for kernel in kernels:
+                assert np.isnan(kernel(daily)[-1]), (kernel, daily)
+
+
+def test_daily_sum_date_inputs_match_resample():
+    """tz‑aware даты через полночь, pd.Series и сырой ndarray агрегируются как resample("1D")."""
+    from stat_ts.core import _daily_sum
+
+    rng = np.random.default_rng(seed=5)
+    # шаг 7 часов: локальные сутки в Москве и UTC‑сутки расходятся
+    naive = pd.date_range("2024-01-01 20:00", periods=40, freq="7h")
+    pnl = rng.normal(0.0, 1.0, size=naive.size)
+
+    aware = naive.tz_localize("Europe/Moscow")
+    cases = [
+        (aware, aware),
+        (pd.Series(aware), aware),
+        (naive.to_numpy(), naive),
+        (pd.Series(naive), naive),
+        (list(aware), aware),
+    ]
+    for dates, index in cases:
+        expected = pd.Series(pnl, index=index).resample("1D").sum().to_numpy()
+        got = _daily_sum(dates, pnl)
+        assert got.shape == expected.shape
+        assert np.allclose(got, expected)
+
+    # UTC‑сутки дали бы другую раскладку – проверка, что тест действительно её ловит
+    utc_days = pd.Series(pnl, index=aware.tz_convert("UTC")).resample("1D").sum().to_numpy()
+    assert utc_days.shape != _daily_sum(aware, pnl).shape or not np.allclose(
+        utc_days, _daily_sum(aware, pnl)
+    )
+
+
+@pytest.mark.parametrize("engine", ["numpy", "polars"])
+def test_nat_dates_dropped(engine):
+    """Бары с датой NaT выбрасываются, как в resample("1D"); ряд из одних NaT – пустые метрики."""
+    if engine == "polars":
+        pytest.importorskip("polars")
+    from stat_ts.core import _DAILY_SUM
+
+    pnl = np.array([1.0, 2.0, 3.0, 4.0])
+    naive = pd.DatetimeIndex(["2024-01-01", None, "2024-01-03", "2024-01-04"])
+    for dates in (naive, naive.tz_localize("Europe/Moscow"), naive.to_numpy()):
+        expected = pd.Series(pnl, index=dates).resample("1D").sum().to_numpy()
+        assert np.allclose(_DAILY_SUM[engine](dates, pnl), expected)
+    stat_ts(naive, pnl, test_period=4, engine=engine)
+
+    df = stat_ts(pd.DatetimeIndex([None, None]), pnl[:2], test_period=2, engine=engine)
+    assert df.isna().all(axis=None)
+    batch = stat_ts_batch([naive, pd.DatetimeIndex([None, None])], [pnl, pnl[:2]], 4)
+    assert batch.iloc[1].isna().all() and batch.iloc[0].notna().any()
+
+
+def test_all_zero_daily_pnl():
+    """Если все подневные суммы нулевые, строка считается без деления на ноль."""
+    dates = pd.date_range("2024-01-01", periods=6, freq="12h")
+    pnl = np.array([0.0, 0.0, 0.01, -0.01, 0.0, 0.0])  # сделки гасятся внутри дня
+    df = stat_ts(dates, pnl, test_period=3, target_type="nom")
+    assert df.loc[0, "Win, %"] == 0.0
+    assert df.loc[0, "Max wins in row"] == 0
+    assert df.loc[0, "Max DD, pp"] == 0.0
+
+    df_zero = stat_ts(dates, np.zeros(6), test_period=3)
+    assert df_zero.loc[0, "trades/year"] == 0
+    assert df_zero.loc[0, "Win, %"] == 0.0